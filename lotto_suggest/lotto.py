@@ -1,3 +1,4 @@
+import itertools
 import random
 import time
 from collections import Counter
@@ -11,32 +12,48 @@ class RandomNumberGenerator:
         self.max_num = 45
         self.count = 6
         
-        # 최근 10회차 로또 당첨번호 (1170회~1179회)
-        self.recent_numbers = [
-            [3, 16, 18, 24, 40, 44],  # 1179회
-            [5, 6, 11, 27, 43, 44],   # 1178회
-            [3, 7, 15, 16, 19, 43],   # 1177회
-            [7, 9, 11, 21, 30, 35],   # 1176회
-            [3, 4, 6, 8, 32, 42],     # 1175회
-            [8, 11, 14, 17, 36, 39],  # 1174회
-            [1, 5, 18, 20, 30, 35],   # 1173회
-            [7, 9, 24, 40, 42, 44],   # 1172회
-            [3, 6, 7, 11, 12, 17],    # 1171회
-            [3, 13, 28, 34, 38, 42]   # 1170회
-        ]
+        # 최근 10회차 로또 당첨번호 (1170회~1179회, 실행 중 변경되지 않으므로 튜플로 고정)
+        self.recent_numbers = (
+            (3, 16, 18, 24, 40, 44),  # 1179회
+            (5, 6, 11, 27, 43, 44),   # 1178회
+            (3, 7, 15, 16, 19, 43),   # 1177회
+            (7, 9, 11, 21, 30, 35),   # 1176회
+            (3, 4, 6, 8, 32, 42),     # 1175회
+            (8, 11, 14, 17, 36, 39),  # 1174회
+            (1, 5, 18, 20, 30, 35),   # 1173회
+            (7, 9, 24, 40, 42, 44),   # 1172회
+            (3, 6, 7, 11, 12, 17),    # 1171회
+            (3, 13, 28, 34, 38, 42)   # 1170회
+        )
         
         # 최근 번호들의 출현 빈도 계산
         self.recent_frequency = self._calculate_frequency()
         
         # 가중치 설정 (최근 번호일수록 낮은 확률)
         self.weights = self._calculate_weights()
+        
+        # 번호 목록과 기본 가중치 리스트는 고정값이므로 한 번만 생성
+        self._nums = tuple(range(self.min_num, self.max_num + 1))
+        self._base_weights = tuple(self.weights[num] for num in self._nums)
+        self._decay_weights = tuple(self._calculate_decay_weights())
+        
+        # 추출 시마다 누적합을 다시 구하지 않도록 누적 가중치 테이블도 미리 생성
+        self._base_cum_weights = tuple(itertools.accumulate(self._base_weights))
+        self._decay_cum_weights = tuple(itertools.accumulate(self._decay_weights))
+        
+        # 최근 출현 번호 집합과 미출현 번호 목록도 고정값이므로 미리 계산
+        self._recent_set = frozenset(self.recent_frequency)
+        self._not_recent = tuple(num for num in self._nums if num not in self._recent_set)
+        
+        # 최근 3회차는 강력 회피, 4~10회차는 약간 회피
+        self._strong_avoid = frozenset().union(*self.recent_numbers[:3])
+        self._weak_avoid = frozenset().union(*self.recent_numbers[3:10]) - self._strong_avoid
+        self._hybrid_weights = tuple(self._calculate_hybrid_weights())
+        self._hybrid_cum_weights = tuple(itertools.accumulate(self._hybrid_weights))
     
     def _calculate_frequency(self):
         """최근 10회차에서 각 번호의 출현 빈도 계산"""
-        all_numbers = []
-        for round_numbers in self.recent_numbers:
-            all_numbers.extend(round_numbers)
-        return Counter(all_numbers)
+        return Counter(num for round_numbers in self.recent_numbers for num in round_numbers)
     
     def _calculate_weights(self):
         """각 번호별 가중치 계산 (최근 번호는 낮은 가중치)"""
@@ -55,6 +72,52 @@ class RandomNumberGenerator:
         
         return weights
     
+    def _calculate_decay_weights(self):
+        """시간 감쇠 가중치 테이블 계산 (번호 목록과 같은 순서)"""
+        decay_weights = [1.0] * len(self._nums)
+        offset = self.min_num
+        
+        for i, round_numbers in enumerate(self.recent_numbers):
+            # 최근일수록 더 강한 가중치 감소 (1회차: 90% 감소, 10회차: 10% 감소)
+            keep = 1 - (0.9 - (i * 0.08))
+            for num in round_numbers:
+                decay_weights[num - offset] *= keep
+        
+        return decay_weights
+    
+    def _calculate_hybrid_weights(self):
+        """하이브리드 회피 가중치 테이블 계산 (번호 목록과 같은 순서)"""
+        weights = []
+        for num in self._nums:
+            if num in self._strong_avoid:
+                weight = 0.2  # 강력 회피 (80% 감소)
+            elif num in self._weak_avoid:
+                weight = 0.6  # 약간 회피 (40% 감소)
+            else:
+                weight = 1.0  # 기본 가중치
+            weights.append(weight)
+        
+        return weights
+    
+    def _weighted_draw_k(self, cum_weights, k):
+        """누적 가중치 테이블로 일괄 추출하는 가중치 비복원 추출 (선택된 번호 리스트 반환)
+        
+        가중치가 0보다 큰 번호가 k개 이상이어야 한다.
+        """
+        picks = []
+        seen = set()
+        
+        # 복원 추출로 여유 있게 뽑은 뒤 중복만 버리고, 모자라면 다시 뽑음
+        while len(picks) < k:
+            for num in random.choices(self._nums, cum_weights=cum_weights, k=k + 2):
+                if num not in seen:
+                    seen.add(num)
+                    picks.append(num)
+                    if len(picks) == k:
+                        break
+        
+        return picks
+    
     def method1_random_sample(self):
         """방법 1: random.sample() 사용 (가장 효율적)"""
         numbers = random.sample(range(self.min_num, self.max_num + 1), self.count)
@@ -85,15 +148,19 @@ class RandomNumberGenerator:
         # LCG 파라미터 (Park and Miller의 값)
         a = 16807
         m = 2**31 - 1
-        seed = int(time.time() * 1000) % m
+        span = self.max_num - self.min_num + 1
+        # seed가 0이면 수열이 0에 고정되므로 1로 대체
+        seed = (time.time_ns() // 1_000_000) % m or 1
         
+        # 루프 안에서 속성 조회 없이 지역 변수만 사용
+        min_num = self.min_num
+        count = self.count
         numbers = set()
-        while len(numbers) < self.count:
-            seed = (a * seed) % m
-            num = (seed % self.max_num) + self.min_num
-            numbers.add(num)
+        while len(numbers) < count:
+            seed = a * seed % m
+            numbers.add(seed % span + min_num)
         
-        return sorted(list(numbers))
+        return sorted(numbers)
     
     def method5_list_pop(self):
         """방법 5: 리스트에서 pop으로 제거하는 방법"""
@@ -102,133 +169,54 @@ class RandomNumberGenerator:
         
         for _ in range(self.count):
             index = random.randint(0, len(numbers) - 1)
-            selected.append(numbers.pop(index))
+            # 선택한 위치를 마지막 원소와 바꾼 뒤 끝에서 pop (O(1))
+            numbers[index], numbers[-1] = numbers[-1], numbers[index]
+            selected.append(numbers.pop())
         
         return sorted(selected)
     
     def method6_weighted_random(self):
         """방법 6: 최근 번호 회피 가중치 적용"""
-        selected = set()
-        
-        while len(selected) < self.count:
-            # 가중치를 적용한 번호 선택
-            numbers = list(range(self.min_num, self.max_num + 1))
-            weights = [self.weights[num] for num in numbers]
-            
-            # 이미 선택된 번호는 가중치를 0으로 설정
-            for i, num in enumerate(numbers):
-                if num in selected:
-                    weights[i] = 0
-            
-            # 가중치가 모두 0이 아닌 경우에만 선택
-            if sum(weights) > 0:
-                num = random.choices(numbers, weights=weights, k=1)[0]
-                selected.add(num)
-        
-        return sorted(list(selected))
+        # 가중치를 적용하여 중복 없이 번호 선택
+        selected = self._weighted_draw_k(self._base_cum_weights, self.count)
+        return sorted(selected)
     
     def method7_anti_frequency(self):
         """방법 7: 반빈도 알고리즘 (최근 안 나온 번호 우선)"""
         # 최근에 안 나온 번호들을 우선적으로 선택
-        not_recent = []
-        recent = set()
-        
-        for round_numbers in self.recent_numbers:
-            recent.update(round_numbers)
-        
-        for num in range(self.min_num, self.max_num + 1):
-            if num not in recent:
-                not_recent.append(num)
-        
         selected = []
         
         # 최근에 안 나온 번호 중에서 먼저 선택
-        available_not_recent = not_recent.copy()
+        available_not_recent = list(self._not_recent)
         while len(selected) < self.count and available_not_recent:
-            num = random.choice(available_not_recent)
-            selected.append(num)
-            available_not_recent.remove(num)
+            # 선택한 위치를 마지막 원소와 바꾼 뒤 끝에서 pop (O(1))
+            index = random.randrange(len(available_not_recent))
+            available_not_recent[index], available_not_recent[-1] = available_not_recent[-1], available_not_recent[index]
+            selected.append(available_not_recent.pop())
         
         # 부족한 개수만큼 나머지에서 선택 (가중치 적용)
         if len(selected) < self.count:
-            remaining = set(range(self.min_num, self.max_num + 1)) - set(selected)
+            # 이미 선택된 번호만 가중치를 0으로 두고 한 번에 추출
+            weights = list(self._base_weights)
+            for num in selected:
+                weights[num - self.min_num] = 0
             
-            while len(selected) < self.count:
-                remaining_list = list(remaining)
-                weights = [self.weights[num] for num in remaining_list]
-                num = random.choices(remaining_list, weights=weights, k=1)[0]
-                selected.append(num)
-                remaining.remove(num)
+            cum_weights = list(itertools.accumulate(weights))
+            selected.extend(self._weighted_draw_k(cum_weights, self.count - len(selected)))
         
         return sorted(selected)
     
     def method8_hybrid_avoidance(self):
         """방법 8: 하이브리드 회피 알고리즘"""
-        # 최근 3회차는 강력 회피, 4~10회차는 약간 회피
-        strong_avoid = set()
-        weak_avoid = set()
-        
-        # 최근 3회차 번호는 강력 회피
-        for i in range(3):
-            strong_avoid.update(self.recent_numbers[i])
-        
-        # 4~10회차 번호는 약간 회피
-        for i in range(3, 10):
-            weak_avoid.update(self.recent_numbers[i])
-        
-        selected = []
-        available = set(range(self.min_num, self.max_num + 1))
-        
-        for _ in range(self.count):
-            # 가능한 선택지 중에서 가중치 적용하여 선택
-            current_available = available - set(selected)
-            
-            if current_available:
-                available_list = list(current_available)
-                weights = []
-                
-                for num in available_list:
-                    if num in strong_avoid:
-                        weight = 0.2  # 강력 회피 (80% 감소)
-                    elif num in weak_avoid:
-                        weight = 0.6  # 약간 회피 (40% 감소)
-                    else:
-                        weight = 1.0  # 기본 가중치
-                    weights.append(weight)
-                
-                num = random.choices(available_list, weights=weights, k=1)[0]
-                selected.append(num)
-        
+        # 최근 3회차는 강력 회피, 4~10회차는 약간 회피한 가중치 테이블로 선택
+        selected = self._weighted_draw_k(self._hybrid_cum_weights, self.count)
         return sorted(selected)
     
     def method9_time_decay_weight(self):
         """방법 9: 시간 감쇠 가중치 (최근일수록 더 강하게 회피)"""
-        selected = set()
-        
-        while len(selected) < self.count:
-            numbers = list(range(self.min_num, self.max_num + 1))
-            weights = []
-            
-            for num in numbers:
-                if num in selected:
-                    weights.append(0)
-                    continue
-                
-                weight = 1.0
-                # 각 회차별로 시간 감쇠 적용
-                for i, round_numbers in enumerate(self.recent_numbers):
-                    if num in round_numbers:
-                        # 최근일수록 더 강한 가중치 감소 (1회차: 90% 감소, 10회차: 10% 감소)
-                        decay_factor = 0.9 - (i * 0.08)
-                        weight *= (1 - decay_factor)
-                
-                weights.append(weight)
-            
-            if sum(weights) > 0:
-                num = random.choices(numbers, weights=weights, k=1)[0]
-                selected.add(num)
-        
-        return sorted(list(selected))
+        # 회차별 감쇠가 미리 반영된 가중치 테이블 사용
+        selected = self._weighted_draw_k(self._decay_cum_weights, self.count)
+        return sorted(selected)
     
     def generate_all_methods(self):
         """모든 방법으로 번호 생성"""
@@ -263,11 +251,7 @@ class RandomNumberGenerator:
     
     def _count_recent_overlap(self, selected_numbers):
         """선택된 번호와 최근 10회차 번호의 중복 개수 계산"""
-        recent_set = set()
-        for round_numbers in self.recent_numbers:
-            recent_set.update(round_numbers)
-        
-        return len(set(selected_numbers) & recent_set)
+        return len(self._recent_set.intersection(selected_numbers))
     
     def show_recent_analysis(self):
         """최근 10회차 분석 정보 출력"""
@@ -277,7 +261,7 @@ class RandomNumberGenerator:
         
         for i, numbers in enumerate(self.recent_numbers):
             round_num = 1179 - i
-            print(f"{round_num}회차: {numbers}")
+            print(f"{round_num}회차: {list(numbers)}")
         
         print(f"\n📊 번호별 출현 빈도:")
         sorted_freq = sorted(self.recent_frequency.items(), key=lambda x: x[1], reverse=True)
@@ -288,10 +272,7 @@ class RandomNumberGenerator:
                 print(f"번호 {num:2d}: {freq}회 출현 (가중치: {weight:.2f})")
         
         # 최근에 전혀 안 나온 번호들
-        not_appeared = []
-        for num in range(self.min_num, self.max_num + 1):
-            if num not in self.recent_frequency:
-                not_appeared.append(num)
+        not_appeared = list(self._not_recent)
         
         if not_appeared:
             print(f"\n🎯 최근 10회차 미출현 번호: {not_appeared}")
@@ -303,6 +284,19 @@ def main():
     """메인 실행 함수"""
     generator = RandomNumberGenerator()
     
+    # 메뉴 선택마다 새로 만들지 않도록 디스패치 테이블은 한 번만 생성
+    methods = {
+        "1": generator.method1_random_sample,
+        "2": generator.method2_set_based,
+        "3": generator.method3_fisher_yates_shuffle,
+        "4": generator.method4_linear_congruential,
+        "5": generator.method5_list_pop,
+        "6": generator.method6_weighted_random,
+        "7": generator.method7_anti_frequency,
+        "8": generator.method8_hybrid_avoidance,
+        "9": generator.method9_time_decay_weight
+    }
+    
     while True:
         print("\n[ 로또 번호 생성기 - 최근 10회차 회피 기능 ]")
         print("1. 모든 방법으로 번호 생성")
@@ -330,17 +324,6 @@ def main():
             print("9) 시간 감쇠 가중치 - 최근 회피")
             
             method_choice = input("번호 입력: ").strip()
-            methods = {
-                "1": generator.method1_random_sample,
-                "2": generator.method2_set_based,
-                "3": generator.method3_fisher_yates_shuffle,
-                "4": generator.method4_linear_congruential,
-                "5": generator.method5_list_pop,
-                "6": generator.method6_weighted_random,
-                "7": generator.method7_anti_frequency,
-                "8": generator.method8_hybrid_avoidance,
-                "9": generator.method9_time_decay_weight
-            }
             
             if method_choice in methods:
                 result = methods[method_choice]()
@@ -1,7 +1,8 @@
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+import itertools
 import random
 import time
 from collections import Counter
@@ -22,29 +23,44 @@ class LottoGenerator:
         self.max_num = 45
         self.count = 6
         
-        # 최근 10회차 로또 당첨번호 (1170회~1179회)
-        self.recent_numbers = [
-            [3, 16, 18, 24, 40, 44],  # 1179회
-            [5, 6, 11, 27, 43, 44],   # 1178회
-            [3, 7, 15, 16, 19, 43],   # 1177회
-            [7, 9, 11, 21, 30, 35],   # 1176회
-            [3, 4, 6, 8, 32, 42],     # 1175회
-            [8, 11, 14, 17, 36, 39],  # 1174회
-            [1, 5, 18, 20, 30, 35],   # 1173회
-            [7, 9, 24, 40, 42, 44],   # 1172회
-            [3, 6, 7, 11, 12, 17],    # 1171회
-            [3, 13, 28, 34, 38, 42]   # 1170회
-        ]
+        # 최근 10회차 로또 당첨번호 (1170회~1179회, 실행 중 변경되지 않으므로 튜플로 고정)
+        self.recent_numbers = (
+            (3, 16, 18, 24, 40, 44),  # 1179회
+            (5, 6, 11, 27, 43, 44),   # 1178회
+            (3, 7, 15, 16, 19, 43),   # 1177회
+            (7, 9, 11, 21, 30, 35),   # 1176회
+            (3, 4, 6, 8, 32, 42),     # 1175회
+            (8, 11, 14, 17, 36, 39),  # 1174회
+            (1, 5, 18, 20, 30, 35),   # 1173회
+            (7, 9, 24, 40, 42, 44),   # 1172회
+            (3, 6, 7, 11, 12, 17),    # 1171회
+            (3, 13, 28, 34, 38, 42)   # 1170회
+        )
         
         self.recent_frequency = self._calculate_frequency()
         self.weights = self._calculate_weights()
+        
+        # 번호 목록과 기본 가중치 리스트는 고정값이므로 한 번만 생성
+        self._nums = tuple(range(self.min_num, self.max_num + 1))
+        self._base_weights = tuple(self.weights[num] for num in self._nums)
+        self._decay_weights = tuple(self._calculate_decay_weights())
+        
+        # 추출 시마다 누적합을 다시 구하지 않도록 누적 가중치 테이블도 미리 생성
+        self._base_cum_weights = tuple(itertools.accumulate(self._base_weights))
+        self._decay_cum_weights = tuple(itertools.accumulate(self._decay_weights))
+        
+        # 최근 출현 번호 집합과 미출현 번호 목록도 고정값이므로 미리 계산
+        self._recent_set = frozenset(self.recent_frequency)
+        self._not_recent = tuple(num for num in self._nums if num not in self._recent_set)
+        
+        # 분석 데이터는 실행 중 바뀌지 않으므로 JSON 본문을 미리 직렬화
+        self.analysis_json = json.dumps(
+            self.get_analysis(), ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
     
     def _calculate_frequency(self):
         """최근 10회차에서 각 번호의 출현 빈도 계산"""
-        all_numbers = []
-        for round_numbers in self.recent_numbers:
-            all_numbers.extend(round_numbers)
-        return Counter(all_numbers)
+        return Counter(num for round_numbers in self.recent_numbers for num in round_numbers)
     
     def _calculate_weights(self):
         """각 번호별 가중치 계산"""
@@ -61,6 +77,38 @@ class LottoGenerator:
         
         return weights
     
+    def _calculate_decay_weights(self):
+        """시간 감쇠 가중치 테이블 계산 (번호 목록과 같은 순서)"""
+        decay_weights = [1.0] * len(self._nums)
+        offset = self.min_num
+        
+        for i, round_numbers in enumerate(self.recent_numbers):
+            # 최근일수록 더 강한 가중치 감소 (1회차: 90% 감소, 10회차: 10% 감소)
+            keep = 1 - (0.9 - (i * 0.08))
+            for num in round_numbers:
+                decay_weights[num - offset] *= keep
+        
+        return decay_weights
+    
+    def _weighted_draw_k(self, cum_weights, k):
+        """누적 가중치 테이블로 일괄 추출하는 가중치 비복원 추출 (선택된 번호 리스트 반환)
+        
+        가중치가 0보다 큰 번호가 k개 이상이어야 한다.
+        """
+        picks = []
+        seen = set()
+        
+        # 복원 추출로 여유 있게 뽑은 뒤 중복만 버리고, 모자라면 다시 뽑음
+        while len(picks) < k:
+            for num in random.choices(self._nums, cum_weights=cum_weights, k=k + 2):
+                if num not in seen:
+                    seen.add(num)
+                    picks.append(num)
+                    if len(picks) == k:
+                        break
+        
+        return picks
+    
     def generate_basic(self) -> List[int]:
         """기본 랜덤 생성"""
         numbers = random.sample(range(self.min_num, self.max_num + 1), self.count)
@@ -68,98 +116,54 @@ class LottoGenerator:
     
     def generate_weighted(self) -> List[int]:
         """가중치 적용 생성"""
-        selected = set()
-        
-        while len(selected) < self.count:
-            numbers = list(range(self.min_num, self.max_num + 1))
-            weights = [self.weights[num] for num in numbers]
-            
-            for i, num in enumerate(numbers):
-                if num in selected:
-                    weights[i] = 0
-            
-            if sum(weights) > 0:
-                num = random.choices(numbers, weights=weights, k=1)[0]
-                selected.add(num)
-        
-        return sorted(list(selected))
+        selected = self._weighted_draw_k(self._base_cum_weights, self.count)
+        return sorted(selected)
     
     def generate_anti_frequency(self) -> List[int]:
         """반빈도 알고리즘"""
-        not_recent = []
-        recent = set()
-        
-        for round_numbers in self.recent_numbers:
-            recent.update(round_numbers)
-        
-        for num in range(self.min_num, self.max_num + 1):
-            if num not in recent:
-                not_recent.append(num)
-        
         selected = []
-        available_not_recent = not_recent.copy()
+        available_not_recent = list(self._not_recent)
         
         while len(selected) < self.count and available_not_recent:
-            num = random.choice(available_not_recent)
-            selected.append(num)
-            available_not_recent.remove(num)
+            index = random.randrange(len(available_not_recent))
+            available_not_recent[index], available_not_recent[-1] = available_not_recent[-1], available_not_recent[index]
+            selected.append(available_not_recent.pop())
         
         if len(selected) < self.count:
-            remaining = set(range(self.min_num, self.max_num + 1)) - set(selected)
+            weights = list(self._base_weights)
+            for num in selected:
+                weights[num - self.min_num] = 0
             
-            while len(selected) < self.count:
-                remaining_list = list(remaining)
-                weights = [self.weights[num] for num in remaining_list]
-                num = random.choices(remaining_list, weights=weights, k=1)[0]
-                selected.append(num)
-                remaining.remove(num)
+            cum_weights = list(itertools.accumulate(weights))
+            selected.extend(self._weighted_draw_k(cum_weights, self.count - len(selected)))
         
         return sorted(selected)
     
     def generate_time_decay(self) -> List[int]:
         """시간 감쇠 가중치"""
-        selected = set()
-        
-        while len(selected) < self.count:
-            numbers = list(range(self.min_num, self.max_num + 1))
-            weights = []
-            
-            for num in numbers:
-                if num in selected:
-                    weights.append(0)
-                    continue
-                
-                weight = 1.0
-                for i, round_numbers in enumerate(self.recent_numbers):
-                    if num in round_numbers:
-                        decay_factor = 0.9 - (i * 0.08)
-                        weight *= (1 - decay_factor)
-                
-                weights.append(weight)
-            
-            if sum(weights) > 0:
-                num = random.choices(numbers, weights=weights, k=1)[0]
-                selected.add(num)
-        
-        return sorted(list(selected))
+        selected = self._weighted_draw_k(self._decay_cum_weights, self.count)
+        return sorted(selected)
     
     def get_analysis(self) -> Dict:
         """분석 데이터 반환"""
-        not_appeared = []
-        for num in range(self.min_num, self.max_num + 1):
-            if num not in self.recent_frequency:
-                not_appeared.append(num)
-        
         return {
             "recent_numbers": self.recent_numbers,
             "frequency": dict(self.recent_frequency),
             "weights": self.weights,
-            "not_appeared": not_appeared
+            "not_appeared": list(self._not_recent)
         }
 
 # 전역 로또 생성기 인스턴스
 lotto_gen = LottoGenerator()
 
+# 생성 방법별 디스패치 테이블 (요청마다 dict를 새로 만들지 않도록 모듈 로드 시 1회 생성)
+METHOD_TABLE = {
+    "basic": lotto_gen.generate_basic,
+    "weighted": lotto_gen.generate_weighted,
+    "anti_frequency": lotto_gen.generate_anti_frequency,
+    "time_decay": lotto_gen.generate_time_decay
+}
+
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
     """메인 페이지"""
@@ -168,23 +172,16 @@ async def home(request: Request):
 @app.get("/api/generate/{method}")
 async def generate_numbers(method: str):
     """번호 생성 API"""
-    methods = {
-        "basic": lotto_gen.generate_basic,
-        "weighted": lotto_gen.generate_weighted,
-        "anti_frequency": lotto_gen.generate_anti_frequency,
-        "time_decay": lotto_gen.generate_time_decay
-    }
-    
-    if method not in methods:
+    generate = METHOD_TABLE.get(method)
+    if generate is None:
         return {"error": "잘못된 방법입니다."}
     
-    numbers = methods[method]()
-    return {"numbers": numbers, "method": method}
+    return {"numbers": generate(), "method": method}
 
 @app.get("/api/analysis")
 async def get_analysis():
     """분석 데이터 API"""
-    return lotto_gen.get_analysis()
+    return Response(content=lotto_gen.analysis_json, media_type="application/json")
 
 @app.get("/api/generate-multiple/{method}/{count}")
 async def generate_multiple(method: str, count: int):
@@ -192,20 +189,11 @@ async def generate_multiple(method: str, count: int):
     if count > 20:  # 최대 20개로 제한
         count = 20
     
-    methods = {
-        "basic": lotto_gen.generate_basic,
-        "weighted": lotto_gen.generate_weighted,
-        "anti_frequency": lotto_gen.generate_anti_frequency,
-        "time_decay": lotto_gen.generate_time_decay
-    }
-    
-    if method not in methods:
+    generate = METHOD_TABLE.get(method)
+    if generate is None:
         return {"error": "잘못된 방법입니다."}
     
-    results = []
-    for i in range(count):
-        numbers = methods[method]()
-        results.append({"id": i+1, "numbers": numbers})
+    results = [{"id": i + 1, "numbers": generate()} for i in range(count)]
     
     return {"results": results, "method": method, "count": count}
 
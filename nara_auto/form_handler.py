@@ -5,23 +5,110 @@
 폼 처리 클래스 모듈
 """
 
-import time
 import logging
 from typing import List
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException, StaleElementReferenceException
 from selenium.webdriver.common.alert import Alert
 
 
+# 요소는 보통 페이지 준비 직후 나타나므로 기본값(0.5초)보다 짧게 폴링
+POLL_FREQUENCY = 0.1
+IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+
+def first_clickable(*locators):
+    """
+    셀렉터에 매칭되는 요소 중 처음으로 클릭 가능한 요소를 찾는 대기 조건
+    
+    셀렉터는 주어진 우선순위대로 확인하고, 각 셀렉터에 매칭된 요소 중
+    화면에 표시되고 활성화된 첫 요소를 반환한다 (숨겨진 요소는 건너뜀).
+    
+    Args:
+        locators: (By, 셀렉터) 튜플들 (앞의 것부터 우선 확인)
+        
+    Returns:
+        WebDriverWait.until에 전달할 조건 함수
+    """
+    def _condition(driver):
+        for by, selector in locators:
+            for element in driver.find_elements(by, selector):
+                if element.is_displayed() and element.is_enabled():
+                    return element
+        return False
+    return _condition
+
+
 class FormFiller:
     """활용신청 폼 자동 입력 클래스"""
     
+    # 후보 셀렉터 (우선순위 순서, union으로 합치면 문서 순서로 바뀌므로 개별 locator로 확인)
+    TEXTAREA_SELECTORS = (
+        "textarea#prcusePurps",
+        "textarea[name='prcusePurps']",
+        "textarea#prcusePurps[name='prcusePurps']",
+        "textarea.input-textarea.h160px",
+        "textarea[title='활용목적 입력']",
+        "textarea[placeholder*='활용목적']",
+        "textarea[id*='purps']",
+        "textarea[name*='purps']"
+    )
+    TEXTAREA_LOCATORS = tuple((By.CSS_SELECTOR, selector) for selector in TEXTAREA_SELECTORS)
+    
+    CHECKBOX_SELECTORS = (
+        "input#useScopeAgreAt",
+        "input[name='useScopeAgreAt']",
+        "input#useScopeAgreAt[name='useScopeAgreAt']",
+        "input#useScopeAgreAt[type='checkbox'][value='Y']",
+        "*:has(> label[for='useScopeAgreAt']) input[type='checkbox']",
+        "input[type='checkbox'][id*='Agre']",
+        "input[type='checkbox'][name*='Agre']",
+        "input[type='checkbox'][value='Y']"
+    )
+    CHECKBOX_LOCATORS = tuple((By.CSS_SELECTOR, selector) for selector in CHECKBOX_SELECTORS)
+    
+    # 활용목적 입력과 동의 체크를 한 번의 WebDriver 호출로 처리하는 스크립트
+    # (셀렉터를 우선순위대로 확인하고 화면에 표시되지 않은 요소는 건너뜀)
+    FILL_FORM_SCRIPT = """
+        const [textareaSelectors, checkboxSelectors, text] = arguments;
+        const firstVisible = (selectors) => {
+            for (const selector of selectors) {
+                let elements;
+                try {
+                    elements = document.querySelectorAll(selector);
+                } catch (e) {
+                    continue;  // 지원하지 않는 셀렉터(:has 등)는 건너뜀
+                }
+                for (const element of elements) {
+                    if (element.offsetParent !== null) {
+                        return element;
+                    }
+                }
+            }
+            return null;
+        };
+        const textarea = firstVisible(textareaSelectors);
+        if (textarea) {
+            textarea.value = text;
+            textarea.dispatchEvent(new Event('input', {bubbles: true}));
+            textarea.dispatchEvent(new Event('change', {bubbles: true}));
+        }
+        const checkbox = firstVisible(checkboxSelectors);
+        if (checkbox && !checkbox.checked) {
+            checkbox.click();
+        }
+        return [
+            !!textarea && textarea.value === text,
+            !!checkbox && checkbox.checked
+        ];
+    """
+    
     def __init__(self, driver: webdriver.Chrome):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.wait = WebDriverWait(driver, 10, poll_frequency=POLL_FREQUENCY, ignored_exceptions=IGNORED_EXCEPTIONS)
         self.purpose_text = "웹 서비스 개발용"
     
     def fill_purpose_text(self) -> bool:
@@ -31,32 +118,19 @@ class FormFiller:
         Returns:
             입력 성공 여부
         """
-        textarea_selectors = [
-            "//textarea[@id='prcusePurps']",
-            "//textarea[@name='prcusePurps']", 
-            "//textarea[@id='prcusePurps' and @name='prcusePurps']",
-            "//textarea[contains(@class, 'input-textarea') and contains(@class, 'h160px')]",
-            "//textarea[@title='활용목적 입력']",
-            "//textarea[contains(@placeholder, '활용목적')]",
-            "//textarea[contains(@id, 'purps')]",
-            "//textarea[contains(@name, 'purps')]"
-        ]
-        
-        for selector in textarea_selectors:
-            try:
-                element = self.wait.until(EC.presence_of_element_located((By.XPATH, selector)))
-                element.clear()
-                element.send_keys(self.purpose_text)
-                
-                logging.info(f"활용목적 입력 성공: {selector}")
-                print("  ✓ 활용목적 입력 완료")
-                return True
-                
-            except (TimeoutException, NoSuchElementException):
-                continue
-            except Exception as e:
-                logging.warning(f"활용목적 입력 시도 실패 ({selector}): {e}")
-                continue
+        try:
+            element = self.wait.until(first_clickable(*self.TEXTAREA_LOCATORS))
+            element.clear()
+            element.send_keys(self.purpose_text)
+            
+            logging.info("활용목적 입력 성공")
+            print("  ✓ 활용목적 입력 완료")
+            return True
+            
+        except (TimeoutException, NoSuchElementException):
+            pass
+        except Exception as e:
+            logging.warning("활용목적 입력 시도 실패: %s", e)
         
         logging.error("활용목적 텍스트 영역을 찾을 수 없음")
         print("  ❌ 활용목적 입력 실패")
@@ -69,40 +143,52 @@ class FormFiller:
         Returns:
             체크 성공 여부
         """
-        checkbox_selectors = [
-            "//input[@id='useScopeAgreAt']",
-            "//input[@name='useScopeAgreAt']",
-            "//input[@id='useScopeAgreAt' and @name='useScopeAgreAt']",
-            "//input[@type='checkbox' and @value='Y' and @id='useScopeAgreAt']",
-            "//label[@for='useScopeAgreAt']/..//input[@type='checkbox']",
-            "//input[@type='checkbox' and contains(@id, 'Agre')]",
-            "//input[@type='checkbox' and contains(@name, 'Agre')]",
-            "//input[@type='checkbox' and @value='Y']"
-        ]
-        
-        for selector in checkbox_selectors:
-            try:
-                element = self.wait.until(EC.element_to_be_clickable((By.XPATH, selector)))
-                
-                # 이미 체크되어 있는지 확인
-                if not element.is_selected():
-                    element.click()
-                    time.sleep(0.5)  # 클릭 후 잠시 대기
-                
-                logging.info(f"동의 체크박스 체크 성공: {selector}")
-                print("  ✓ 이용허락범위 동의 완료")
-                return True
-                
-            except (TimeoutException, NoSuchElementException, ElementClickInterceptedException):
-                continue
-            except Exception as e:
-                logging.warning(f"동의 체크박스 클릭 시도 실패 ({selector}): {e}")
-                continue
+        try:
+            element = self.wait.until(first_clickable(*self.CHECKBOX_LOCATORS))
+            
+            # 이미 체크되어 있는지 확인
+            if not element.is_selected():
+                element.click()
+                # 체크 상태가 반영되는 즉시 진행
+                self.wait.until(EC.element_selection_state_to_be(element, True))
+            
+            logging.info("동의 체크박스 체크 성공")
+            print("  ✓ 이용허락범위 동의 완료")
+            return True
+            
+        except (TimeoutException, NoSuchElementException, ElementClickInterceptedException):
+            pass
+        except Exception as e:
+            logging.warning("동의 체크박스 클릭 시도 실패: %s", e)
         
         logging.error("동의 체크박스를 찾을 수 없음")
         print("  ❌ 이용허락범위 동의 실패")
         return False
     
+    def fill_form_with_script(self) -> bool:
+        """
+        활용목적 입력과 동의 체크를 단일 스크립트로 처리
+        
+        Returns:
+            두 항목 모두 처리되었는지 여부
+        """
+        try:
+            purpose_ok, agreement_ok = self.driver.execute_script(
+                self.FILL_FORM_SCRIPT, list(self.TEXTAREA_SELECTORS), list(self.CHECKBOX_SELECTORS), self.purpose_text
+            )
+        except Exception as e:
+            logging.warning("스크립트 폼 작성 실패: %s", e)
+            return False
+        
+        if purpose_ok and agreement_ok:
+            logging.info("스크립트로 활용목적 입력 및 동의 체크 완료")
+            print("  ✓ 활용목적 입력 완료")
+            print("  ✓ 이용허락범위 동의 완료")
+            return True
+        
+        logging.info("스크립트 폼 작성 불완전 (활용목적: %s, 동의: %s)", purpose_ok, agreement_ok)
+        return False
+    
     def fill_form(self) -> bool:
         """
         전체 폼 작성
@@ -112,8 +198,16 @@ class FormFiller:
         """
         print("  📝 폼 작성 중...")
         
-        # 페이지 로딩 완료 대기
-        time.sleep(2)
+        # DOM 구성 완료 대기 (eager 로딩 전략에 맞춰 이미지 등 부가 리소스는 기다리지 않음)
+        try:
+            self.wait.until(lambda driver: driver.execute_script("return document.readyState") != "loading")
+        except TimeoutException:
+            logging.warning("폼 페이지 로딩 시간 초과")
+        
+        # 한 번의 스크립트 호출로 처리되면 요소별 처리 생략
+        if self.fill_form_with_script():
+            print("  ✅ 폼 작성 완료")
+            return True
         
         # 활용목적 입력
         if not self.fill_purpose_text():
@@ -130,9 +224,31 @@ class FormFiller:
 class FormSubmitter:
     """활용신청 폼 제출 클래스"""
     
+    # 제출 버튼 후보 (우선순위 순서, 텍스트 기반 후보는 CSS로 표현할 수 없어 XPath 사용)
+    # union으로 합치면 문서 순서로 바뀌어 검색 버튼 등 넓은 후보가 먼저 잡히므로 개별 셀렉터로 유지
+    SUBMIT_BUTTON_LOCATORS = (
+        (By.CSS_SELECTOR, "div#loadingDiv button[class='button blue']"),
+        (By.XPATH, "//button[contains(text(), '활용신청')]"),
+        (By.CSS_SELECTOR, "button[onclick*='fn_save']"),
+        (By.CSS_SELECTOR, "button[type='submit']"),
+        (By.CSS_SELECTOR, "input[type='submit']"),
+        (By.CSS_SELECTOR, "button[class*='btn-submit']"),
+        (By.CSS_SELECTOR, "button[class*='button'][class*='blue']"),
+        (By.XPATH, "//button[contains(text(), '신청')]"),
+        (By.XPATH, "//button[contains(text(), '저장')]"),
+        (By.CSS_SELECTOR, "button[value*='신청']"),
+        (By.CSS_SELECTOR, "input[value*='신청']")
+    )
+    # 제출 완료 문구 (모든 페이지 하단 스크립트의 '뉴스레터 신청이 완료되었습니다' 문구와
+    # 구분되도록 script/style을 제외하고, 요소 자신의 텍스트에 '신청되었습니다'가 있는 경우만 인정)
+    COMPLETION_XPATH = "//*[not(self::script) and not(self::style)][text()[contains(normalize-space(.), '신청되었습니다')]]"
+    
+    # 제출 후 완료 신호를 기다리는 최대 시간(초)
+    COMPLETION_TIMEOUT = 15
+    
     def __init__(self, driver: webdriver.Chrome):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.wait = WebDriverWait(driver, 10, poll_frequency=POLL_FREQUENCY, ignored_exceptions=IGNORED_EXCEPTIONS)
     
     def find_submit_button(self):
         """
@@ -141,30 +257,14 @@ class FormSubmitter:
         Returns:
             제출 버튼 element 또는 None
         """
-        submit_button_selectors = [
-            "//div[@id='loadingDiv']//button[@class='button blue']",
-            "//button[contains(text(), '활용신청')]",
-            "//button[contains(@onclick, 'fn_save')]",
-            "//button[@type='submit']",
-            "//input[@type='submit']",
-            "//button[contains(@class, 'btn-submit')]",
-            "//button[contains(@class, 'button') and contains(@class, 'blue')]",
-            "//button[contains(text(), '신청')]",
-            "//button[contains(text(), '저장')]",
-            "//button[contains(@value, '신청')]",
-            "//input[contains(@value, '신청')]"
-        ]
-        
-        for selector in submit_button_selectors:
-            try:
-                element = self.wait.until(EC.element_to_be_clickable((By.XPATH, selector)))
-                logging.info(f"제출 버튼 발견: {selector}")
-                return element
-            except (TimeoutException, NoSuchElementException):
-                continue
-            except Exception as e:
-                logging.warning(f"제출 버튼 찾기 시도 실패 ({selector}): {e}")
-                continue
+        try:
+            element = self.wait.until(first_clickable(*self.SUBMIT_BUTTON_LOCATORS))
+            logging.info("제출 버튼 발견")
+            return element
+        except (TimeoutException, NoSuchElementException):
+            pass
+        except Exception as e:
+            logging.warning("제출 버튼 찾기 시도 실패: %s", e)
         
         return None
     
@@ -177,9 +277,9 @@ class FormSubmitter:
         """
         try:
             # Alert 대기 (최대 5초)
-            alert = WebDriverWait(self.driver, 5).until(EC.alert_is_present())
+            alert = WebDriverWait(self.driver, 5, poll_frequency=POLL_FREQUENCY).until(EC.alert_is_present())
             alert_text = alert.text
-            logging.info(f"Alert 창 감지: {alert_text}")
+            logging.info("Alert 창 감지: %s", alert_text)
             
             # Alert 승인
             alert.accept()
@@ -192,13 +292,32 @@ class FormSubmitter:
             return True
             
         except Exception as e:
-            logging.error(f"Alert 처리 오류: {e}")
+            logging.error("Alert 처리 오류: %s", e)
             print(f"  ⚠️  Alert 처리 오류: {e}")
             return False
     
+    def wait_for_completion(self, previous_url: str) -> bool:
+        """
+        제출 처리 완료 대기 (페이지 이동 또는 완료 문구 표시)
+        
+        Args:
+            previous_url: 제출 전 폼 페이지 URL
+            
+        Returns:
+            완료 신호 확인 여부
+        """
+        try:
+            WebDriverWait(self.driver, self.COMPLETION_TIMEOUT, poll_frequency=POLL_FREQUENCY).until(EC.any_of(
+                EC.url_changes(previous_url),
+                EC.visibility_of_element_located((By.XPATH, self.COMPLETION_XPATH))
+            ))
+            return True
+        except TimeoutException:
+            return False
+    
     def submit_form(self) -> bool:
         """
-        폼 제출
+        폼 제출 (제출 버튼 클릭 및 Alert 처리, 완료 확인은 wait_for_completion에서 수행)
         
         Returns:
             제출 성공 여부
@@ -217,23 +336,19 @@ class FormSubmitter:
             submit_button.click()
             logging.info("제출 버튼 클릭 완료")
             
-            # Alert 처리
-            time.sleep(1)  # Alert 대기를 위한 짧은 지연
+            # Alert 처리 (handle_alert에서 Alert 출현을 직접 대기)
             if not self.handle_alert():
                 print("  ⚠️  Alert 처리에 문제가 있었지만 계속 진행합니다")
             
-            # 제출 처리 완료 대기
-            time.sleep(5)
-            
             print("  ✅ 폼 제출 완료")
             return True
             
         except ElementClickInterceptedException as e:
-            logging.error(f"제출 버튼 클릭 방해: {e}")
+            logging.error("제출 버튼 클릭 방해: %s", e)
             print("  ❌ 제출 버튼을 클릭할 수 없습니다 (다른 요소에 의해 가려짐)")
             return False
             
         except Exception as e:
-            logging.error(f"폼 제출 오류: {e}")
+            logging.error("폼 제출 오류: %s", e)
             print(f"  ❌ 폼 제출 오류: {e}")
             return False
\ No newline at end of file
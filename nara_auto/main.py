@@ -8,8 +8,12 @@
 import os
 import sys
 import time
+import shutil
+import argparse
 import logging
-from typing import List, Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Optional
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
@@ -17,8 +21,47 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
-from form_handler import FormFiller, FormSubmitter
-from utils import setup_logging, print_banner, print_results
+from form_handler import FormFiller, FormSubmitter, first_clickable
+from utils import setup_logging, print_banner, print_results, UDDI_PATTERN
+
+PORTAL_URL = "https://www.data.go.kr/"
+SESSION_EXPIRED = "로그인 세션 만료"
+
+# 제출 완료 신호를 확인하지 못했을 때 진행 중인 저장 요청이 끝나도록 기다리는 시간(초)
+SUBMIT_SETTLE_SECONDS = 5
+
+# 동시에 띄울 브라우저 수 (1이면 로그인한 브라우저로 순차 처리)
+MAX_WORKERS = int(os.environ.get("NARA_WORKERS", "1"))
+
+# 병렬 처리용 브라우저를 헤드리스로 실행할지 여부 (로그인용 브라우저는 항상 화면 표시)
+HEADLESS_WORKERS = os.environ.get("NARA_HEADLESS", "1") == "1"
+
+# 로그인 세션(쿠키/SSO 토큰)을 실행 간에 유지하기 위한 Chrome 프로필 디렉토리
+PROFILE_DIR = os.path.abspath(".chrome_profile")
+
+# 로그인 상태에서만 표시되는 로그아웃 링크
+LOGOUT_LINK_CSS = "a[href*='actionLogout']"
+
+# 로그인 상태에서만 화면에 표시되는 문구 (비로그인 메뉴에도 있는 마이페이지 등은 제외)
+LOGIN_INDICATORS = ("로그아웃",)
+
+# 보이는 로그아웃 링크를 먼저 확인하고, 없으면 화면에 표시된 본문에서 로그인 문구를 찾는 스크립트 (없으면 null)
+LOGIN_PROBE_SCRIPT = """
+const link = Array.from(document.querySelectorAll(arguments[0])).find(el => el.offsetParent !== null);
+if (link) return arguments[0];
+const text = document.body ? document.body.innerText : "";
+return arguments[1].find(indicator => text.includes(indicator)) || null;
+"""
+
+# 세션 만료 시 리다이렉트되는 URL 문구와 오류 페이지 제목 문구
+LOGIN_URL_PATTERNS = ("login", "auth")
+ERROR_TITLE_PATTERNS = ("오류", "404", "Not Found")
+
+# 로그인 완료 후 이동하는 페이지 URL 문구
+LOGGED_IN_URL_PATTERNS = ("main.do", "mypage", "data.go.kr")
+
+# 폼 처리에 필요 없는 이미지/폰트 요청 차단 목록 (CSS는 요소 표시 여부 판단에 필요하므로 유지)
+BLOCKED_URL_PATTERNS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.ico", "*.woff", "*.woff2", "*.ttf"]
 
 
 def read_uddi_file(filename: str = "uddi.txt") -> List[str]:
@@ -32,7 +75,7 @@ def read_uddi_file(filename: str = "uddi.txt") -> List[str]:
         유효한 UDDI 목록
     """
     if not os.path.exists(filename):
-        logging.error(f"UDDI 파일을 찾을 수 없습니다: {filename}")
+        logging.error("UDDI 파일을 찾을 수 없습니다: %s", filename)
         print(f"❌ 오류: {filename} 파일이 존재하지 않습니다.")
         print("uddi.txt 파일을 생성하고 UDDI 목록을 입력해주세요.")
         print("예시 형식 (탭으로 구분):")
@@ -41,47 +84,55 @@ def read_uddi_file(filename: str = "uddi.txt") -> List[str]:
         return []
     
     uddi_list = []
+    seen = set()
+    duplicate_count = 0
+    # 라인마다 로그 메시지를 만들지 않도록 INFO 출력 여부를 한 번만 확인
+    log_each = logging.getLogger().isEnabledFor(logging.INFO)
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
+        # 파일 전체를 바이트로 한 번에 읽고 줄 단위 분리 (UDDI는 ASCII이므로 유효한 값만 디코딩)
+        with open(filename, 'rb') as f:
+            data = f.read()
+        
+        for line_num, line in enumerate(data.split(b'\n'), 1):
+            line = line.strip()
+            
+            # 빈 줄이나 주석 제외
+            if not line or line.startswith(b'#'):
+                continue
+            
+            # 탭으로 구분된 경우 첫 번째 값만 추출
+            tab = line.find(b'\t')
+            uddi = line[:tab].strip() if tab >= 0 else line
+            
+            # UDDI 형식 검증 (사전 컴파일된 정규식으로 한 번에 확인)
+            if UDDI_PATTERN.fullmatch(uddi):
+                uddi = uddi.decode('utf-8')
                 
-                # 빈 줄이나 주석 제외
-                if not line or line.startswith('#'):
+                # 읽는 중에 순서를 유지하면서 중복 제거
+                if uddi in seen:
+                    duplicate_count += 1
                     continue
-                
-                # 탭으로 구분된 경우 첫 번째 값만 추출
-                if '\t' in line:
-                    uddi = line.split('\t')[0].strip()
-                    logging.info(f"탭 구분 형식에서 UDDI 추출 (라인 {line_num}): {uddi}")
-                else:
-                    uddi = line.strip()
-                    logging.info(f"단순 형식에서 UDDI 추출 (라인 {line_num}): {uddi}")
-                
-                # UDDI 형식 검증 (기본적인 형식 체크)
-                if uddi.startswith('uddi:') and len(uddi) > 10:
-                    uddi_list.append(uddi)
-                    logging.info(f"UDDI 읽기 성공 (라인 {line_num}): {uddi}")
-                else:
-                    logging.warning(f"잘못된 UDDI 형식 (라인 {line_num}): {uddi}")
-                    print(f"⚠️  잘못된 형식 무시 (라인 {line_num}): {uddi}")
+                seen.add(uddi)
+                uddi_list.append(uddi)
+                if log_each:
+                    logging.info("UDDI 읽기 성공 (라인 %d): %s", line_num, uddi)
+            else:
+                uddi = uddi.decode('utf-8', errors='replace')
+                logging.warning("잘못된 UDDI 형식 (라인 %d): %s", line_num, uddi)
+                print(f"⚠️  잘못된 형식 무시 (라인 {line_num}): {uddi}")
     
     except Exception as e:
-        logging.error(f"파일 읽기 오류: {e}")
+        logging.error("파일 읽기 오류: %s", e)
         print(f"❌ 파일 읽기 오류: {e}")
         return []
     
     if uddi_list:
-        logging.info(f"총 {len(uddi_list)}개의 유효한 UDDI를 읽었습니다.")
-        print(f"✅ {len(uddi_list)}개의 UDDI를 성공적으로 읽었습니다.")
+        logging.info("총 %d개의 유효한 UDDI를 읽었습니다.", len(uddi_list) + duplicate_count)
+        print(f"✅ {len(uddi_list) + duplicate_count}개의 UDDI를 성공적으로 읽었습니다.")
         
-        # 중복 제거
-        unique_uddi_list = list(dict.fromkeys(uddi_list))  # 순서 유지하면서 중복 제거
-        if len(unique_uddi_list) != len(uddi_list):
-            removed_count = len(uddi_list) - len(unique_uddi_list)
-            print(f"📋 중복된 {removed_count}개의 UDDI를 제거했습니다.")
-            logging.info(f"중복 제거: {removed_count}개 제거, 최종 {len(unique_uddi_list)}개")
-            return unique_uddi_list
+        if duplicate_count:
+            print(f"📋 중복된 {duplicate_count}개의 UDDI를 제거했습니다.")
+            logging.info("중복 제거: %d개 제거, 최종 %d개", duplicate_count, len(uddi_list))
         
     else:
         print("❌ 유효한 UDDI가 없습니다.")
@@ -89,10 +140,14 @@ def read_uddi_file(filename: str = "uddi.txt") -> List[str]:
     return uddi_list
 
 
-def setup_driver() -> webdriver.Chrome:
+def setup_driver(profile_dir: Optional[str] = None, headless: bool = False) -> webdriver.Chrome:
     """
     Chrome 드라이버 초기화
     
+    Args:
+        profile_dir: 사용할 Chrome 프로필 디렉토리 (None이면 임시 프로필)
+        headless: 화면 없이 실행할지 여부 (수동 로그인이 필요 없는 브라우저만 사용)
+        
     Returns:
         Chrome WebDriver 인스턴스
     """
@@ -105,16 +160,96 @@ def setup_driver() -> webdriver.Chrome:
     chrome_options.add_argument("--disable-web-security")
     chrome_options.add_argument("--allow-running-insecure-content")
     
+    # driver.get은 DOMContentLoaded까지만 대기 (필요한 요소는 명시적 대기로 확인)
+    chrome_options.page_load_strategy = 'eager'
+    
+    # 자동화에 불필요한 백그라운드 기능 비활성화
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-background-networking")
+    chrome_options.add_argument("--disable-sync")
+    chrome_options.add_argument("--disable-default-apps")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    
+    if headless:
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--disable-gpu")
+    
+    # 프로필 디렉토리는 Chrome 인스턴스 하나만 사용할 수 있으므로 로그인용 브라우저에만 지정
+    if profile_dir:
+        chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+        chrome_options.add_argument("--profile-directory=Default")
+    
     try:
         driver = webdriver.Chrome(options=chrome_options)
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        # 대기 시간은 WebDriverWait로만 제어
+        driver.implicitly_wait(0)
         logging.info("Chrome 드라이버 초기화 성공")
         return driver
     except Exception as e:
-        logging.error(f"Chrome 드라이버 초기화 실패: {e}")
+        logging.error("Chrome 드라이버 초기화 실패: %s", e)
         print(f"❌ Chrome 드라이버 초기화 실패: {e}")
         print("Chrome 브라우저와 ChromeDriver가 설치되어 있는지 확인해주세요.")
-        sys.exit(1)
+        # 병렬 처리에서는 브라우저별로 실패를 처리하므로 종료는 호출하는 쪽에서 결정
+        raise
+
+
+def block_heavy_resources(driver: webdriver.Chrome):
+    """
+    CDP로 이미지/폰트 요청을 차단하여 페이지 로딩량 감소
+    
+    로그인 화면은 사용자가 직접 조작하므로 로그인 이후에만 적용한다.
+    
+    Args:
+        driver: Chrome WebDriver 인스턴스
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        logging.info("이미지/폰트 요청 차단 설정 완료")
+    except Exception as e:
+        logging.warning("리소스 차단 설정 실패: %s", e)
+
+
+def find_login_indicator(driver: webdriver.Chrome, timeout: float) -> Optional[str]:
+    """
+    페이지에 로그아웃 링크나 로그인 문구가 보일 때까지 대기 (스크립트 한 번으로 모두 확인)
+    
+    Args:
+        driver: Chrome WebDriver 인스턴스
+        timeout: 최대 대기 시간(초)
+        
+    Returns:
+        발견된 로그아웃 링크 선택자 또는 로그인 문구 (시간 초과 시 None)
+    """
+    try:
+        return WebDriverWait(driver, timeout).until(
+            lambda d: d.execute_script(LOGIN_PROBE_SCRIPT, LOGOUT_LINK_CSS, list(LOGIN_INDICATORS))
+        )
+    except TimeoutException:
+        return None
+
+
+def is_logged_in(driver: webdriver.Chrome) -> bool:
+    """
+    저장된 프로필로 이미 로그인되어 있는지 확인
+    
+    Args:
+        driver: Chrome WebDriver 인스턴스
+        
+    Returns:
+        로그인 여부
+    """
+    try:
+        driver.get(PORTAL_URL)
+        # 로그아웃 링크가 보일 때만 저장된 세션을 사용하고, 아니면 수동 로그인으로 진행
+        WebDriverWait(driver, 5).until(EC.visibility_of_any_elements_located((By.CSS_SELECTOR, LOGOUT_LINK_CSS)))
+        return True
+    except TimeoutException:
+        return False
+    except Exception as e:
+        logging.warning("로그인 상태 확인 오류: %s", e)
+        return False
 
 
 def wait_for_manual_login(driver: webdriver.Chrome) -> bool:
@@ -132,7 +267,10 @@ def wait_for_manual_login(driver: webdriver.Chrome) -> bool:
     try:
         print("🌐 SSO 로그인 페이지로 이동 중...")
         driver.get(sso_url)
-        time.sleep(3)
+        try:
+            WebDriverWait(driver, 10).until(EC.url_contains("auth.data.go.kr"))
+        except TimeoutException:
+            logging.warning("SSO 로그인 페이지 로딩 시간 초과")
         
         print("\n" + "="*60)
         print("📋 수동 로그인이 필요합니다")
@@ -145,25 +283,16 @@ def wait_for_manual_login(driver: webdriver.Chrome) -> bool:
         input("Enter 키를 눌러 계속하세요...")
         
         # 로그인 상태 확인
-        wait = WebDriverWait(driver, 10)
-        login_indicators = [
-            "로그아웃", "마이페이지", "내정보", "MY PAGE", "마이데이터"
-        ]
-        
-        for indicator in login_indicators:
-            try:
-                element = wait.until(EC.presence_of_element_located((By.XPATH, f"//*[contains(text(), '{indicator}')]")))
-                if element:
-                    logging.info(f"로그인 확인: '{indicator}' 요소 발견")
-                    print("✅ 로그인이 확인되었습니다.")
-                    return True
-            except TimeoutException:
-                continue
+        indicator = find_login_indicator(driver, 10)
+        if indicator:
+            logging.info("로그인 확인: '%s' 요소 발견", indicator)
+            print("✅ 로그인이 확인되었습니다.")
+            return True
         
         # URL 패턴으로도 확인
         current_url = driver.current_url
-        if any(pattern in current_url for pattern in ["main.do", "mypage", "data.go.kr"]):
-            logging.info(f"로그인 확인: URL 패턴 매칭 ({current_url})")
+        if any(pattern in current_url for pattern in LOGGED_IN_URL_PATTERNS):
+            logging.info("로그인 확인: URL 패턴 매칭 (%s)", current_url)
             print("✅ 로그인이 확인되었습니다.")
             return True
         
@@ -172,24 +301,98 @@ def wait_for_manual_login(driver: webdriver.Chrome) -> bool:
         return True  # 일단 진행해보기
         
     except Exception as e:
-        logging.error(f"로그인 프로세스 오류: {e}")
+        logging.error("로그인 프로세스 오류: %s", e)
         print(f"❌ 로그인 프로세스 오류: {e}")
         return False
 
 
-def process_uddi_list(driver: webdriver.Chrome, uddi_list: List[str]) -> Dict[str, Any]:
+def process_single_uddi(driver: webdriver.Chrome, form_filler: FormFiller,
+                        form_submitter: FormSubmitter, uddi: str) -> Optional[str]:
+    """
+    UDDI 1건 활용신청 처리
+    
+    Args:
+        driver: Chrome WebDriver 인스턴스
+        form_filler: 해당 드라이버에 연결된 폼 입력기
+        form_submitter: 해당 드라이버에 연결된 폼 제출기
+        uddi: 처리할 UDDI
+        
+    Returns:
+        성공 시 None, 실패 시 실패 사유
+    """
+    try:
+        # 직접 활용신청 폼 페이지 접근
+        form_url = f"https://www.data.go.kr/iim/api/selectDevAcountRequestForm.do?publicDataDetailPk={uddi}"
+        logging.info("폼 페이지 접근: %s", form_url)
+        
+        print(f"  🌐 폼 페이지 접근 중...")
+        driver.get(form_url)
+        
+        # 활용목적 입력란 또는 로그인 리다이렉트가 나타날 때까지 대기 (최대 10초)
+        wait = WebDriverWait(driver, 10)
+        try:
+            wait.until(EC.any_of(
+                first_clickable(*FormFiller.TEXTAREA_LOCATORS),
+                *(EC.url_contains(pattern) for pattern in LOGIN_URL_PATTERNS)
+            ))
+        except TimeoutException:
+            logging.warning("페이지 로딩 시간 초과")
+        
+        # 현재 URL과 제목을 스크립트 한 번으로 함께 조회
+        current_url, page_title = driver.execute_script("return [location.href, document.title];")
+        
+        # 페이지 로딩 확인
+        if any(pattern in page_title for pattern in ERROR_TITLE_PATTERNS):
+            print(f"  ❌ 페이지 접근 오류: {page_title}")
+            return f"페이지 접근 오류 (제목: {page_title})"
+        
+        # 로그인 리다이렉트 확인
+        if any(pattern in current_url for pattern in LOGIN_URL_PATTERNS):
+            print(f"  ❌ 로그인 세션이 만료되었습니다. 다시 로그인해주세요.")
+            return SESSION_EXPIRED
+        
+        # 폼 작성
+        if not form_filler.fill_form():
+            print(f"  ❌ 폼 작성 실패: {uddi}")
+            return "폼 작성 실패"
+        
+        # 폼 제출
+        if not form_submitter.submit_form():
+            print(f"  ❌ 폼 제출 실패: {uddi}")
+            return "폼 제출 실패"
+        
+        # 저장 요청이 끝났다는 신호를 확인한 뒤 다음 UDDI로 진행 (다음 페이지 이동이 요청을 끊지 않도록)
+        print("  ⏳ 제출 처리 대기 중...")
+        if not form_submitter.wait_for_completion(current_url):
+            logging.warning("제출 완료 확인 시간 초과: %s", uddi)
+            time.sleep(SUBMIT_SETTLE_SECONDS)
+        
+        print(f"  ✅ 성공: {uddi}")
+        logging.info("UDDI 처리 완료: %s", uddi)
+        return None
+        
+    except Exception as e:
+        print(f"  ❌ 오류 발생: {uddi} - {e}")
+        logging.error("UDDI 처리 오류 (%s): %s", uddi, e)
+        return f"처리 중 오류: {str(e)}"
+
+
+def process_uddi_list(driver: webdriver.Chrome, uddi_list: List[str],
+                      stop_event: Optional[threading.Event] = None) -> Dict[str, Any]:
     """
     UDDI별 순차 처리 루프
     
     Args:
         driver: Chrome WebDriver 인스턴스
         uddi_list: 처리할 UDDI 목록
+        stop_event: 다른 브라우저와 공유하는 세션 만료 신호 (병렬 처리 시)
         
     Returns:
         처리 결과 딕셔너리
     """
+    total = len(uddi_list)
     results = {
-        'total': len(uddi_list),
+        'total': total,
         'success': 0,
         'failed': [],
         'failed_details': {}
@@ -198,88 +401,113 @@ def process_uddi_list(driver: webdriver.Chrome, uddi_list: List[str]) -> Dict[st
     form_filler = FormFiller(driver)
     form_submitter = FormSubmitter(driver)
     
-    print(f"\n🔄 {len(uddi_list)}개의 UDDI 처리를 시작합니다...")
+    print(f"\n🔄 {total}개의 UDDI 처리를 시작합니다...")
     
     for i, uddi in enumerate(uddi_list, 1):
-        print(f"\n📝 [{i}/{len(uddi_list)}] 처리 중: {uddi}")
-        logging.info(f"[{i}/{len(uddi_list)}] UDDI 처리 시작: {uddi}")
+        # 다른 브라우저에서 세션 만료가 확인되면 중단
+        if stop_event is not None and stop_event.is_set():
+            break
         
+        # 진행 표시 문자열은 항목당 한 번만 만들어 출력과 로그에 함께 사용
+        progress = f"[{i}/{total}]"
+        print(f"\n📝 {progress} 처리 중: {uddi}")
+        logging.info("%s UDDI 처리 시작: %s", progress, uddi)
+        
+        error = process_single_uddi(driver, form_filler, form_submitter, uddi)
+        if error is None:
+            results['success'] += 1
+            continue
+        
+        results['failed'].append(uddi)
+        results['failed_details'][uddi] = error
+        if error == SESSION_EXPIRED:
+            if stop_event is not None:
+                stop_event.set()
+            break  # 전체 프로세스 중단
+    
+    return results
+
+
+def apply_session_cookies(driver: webdriver.Chrome, cookies: List[Dict[str, Any]]):
+    """
+    로그인된 브라우저의 쿠키를 다른 드라이버에 복사
+    
+    Args:
+        driver: 쿠키를 적용할 Chrome WebDriver 인스턴스
+        cookies: 포털 페이지에서 가져온 로그인된 드라이버의 get_cookies() 결과
+    """
+    # 쿠키는 해당 도메인 페이지에 있을 때만 추가할 수 있음
+    driver.get(PORTAL_URL)
+    for cookie in cookies:
         try:
-            # 직접 활용신청 폼 페이지 접근
-            form_url = f"https://www.data.go.kr/iim/api/selectDevAcountRequestForm.do?publicDataDetailPk={uddi}"
-            logging.info(f"폼 페이지 접근: {form_url}")
-            
-            print(f"  🌐 폼 페이지 접근 중...")
-            driver.get(form_url)
-            
-            # 페이지 로딩 대기 (최대 10초)
-            wait = WebDriverWait(driver, 10)
+            driver.add_cookie(cookie)
+        except Exception as e:
+            logging.warning("쿠키 적용 실패 (%s): %s", cookie.get('name'), e)
+
+
+def process_uddi_list_parallel(cookies: List[Dict[str, Any]], uddi_list: List[str],
+                               max_workers: int) -> Dict[str, Any]:
+    """
+    UDDI 병렬 처리 (목록을 브라우저 수만큼 나누고 각 브라우저가 자기 몫을 순차 처리)
+    
+    Args:
+        cookies: 로그인된 드라이버의 get_cookies() 결과
+        uddi_list: 처리할 UDDI 목록
+        max_workers: 동시에 띄울 브라우저 수
+        
+    Returns:
+        처리 결과 딕셔너리
+    """
+    results = {
+        'total': len(uddi_list),
+        'success': 0,
+        'failed': [],
+        'failed_details': {}
+    }
+    
+    # 번갈아 배분해 각 브라우저의 처리량을 고르게 유지
+    shards = [uddi_list[k::max_workers] for k in range(max_workers)]
+    shards = [shard for shard in shards if shard]
+    session_expired = threading.Event()
+    
+    def process_shard(shard: List[str]) -> Dict[str, Any]:
+        driver = setup_driver(headless=HEADLESS_WORKERS)
+        try:
+            block_heavy_resources(driver)
+            apply_session_cookies(driver, cookies)
+            return process_uddi_list(driver, shard, session_expired)
+        finally:
+            driver.quit()
+    
+    print(f"\n🔄 {len(uddi_list)}개의 UDDI 처리를 {len(shards)}개 브라우저로 시작합니다...")
+    
+    with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+        future_to_shard = {executor.submit(process_shard, shard): shard for shard in shards}
+        for future in as_completed(future_to_shard):
             try:
-                # 페이지 로딩 완료 대기
-                wait.until(lambda driver: driver.execute_script('return document.readyState') == 'complete')
-                time.sleep(3)  # 추가 대기
-            except TimeoutException:
-                logging.warning("페이지 로딩 시간 초과")
-            
-            # 페이지 로딩 확인
-            page_title = driver.title
-            if "오류" in page_title or "404" in page_title or "Not Found" in page_title:
-                results['failed'].append(uddi)
-                results['failed_details'][uddi] = f"페이지 접근 오류 (제목: {page_title})"
-                print(f"  ❌ 페이지 접근 오류: {page_title}")
+                shard_results = future.result()
+            except Exception as e:
+                # 브라우저 자체가 실패하면 해당 몫 전체를 실패 처리
+                logging.error("브라우저 작업 오류: %s", e)
+                for uddi in future_to_shard[future]:
+                    results['failed'].append(uddi)
+                    results['failed_details'][uddi] = f"처리 중 오류: {str(e)}"
                 continue
             
-            # 로그인 리다이렉트 확인
-            current_url = driver.current_url
-            if "login" in current_url or "auth" in current_url:
-                results['failed'].append(uddi)
-                results['failed_details'][uddi] = "로그인 세션 만료"
-                print(f"  ❌ 로그인 세션이 만료되었습니다. 다시 로그인해주세요.")
-                break  # 전체 프로세스 중단
-            
-            # 폼 작성
-            if not form_filler.fill_form():
-                results['failed'].append(uddi)
-                results['failed_details'][uddi] = "폼 작성 실패"
-                print(f"  ❌ 폼 작성 실패: {uddi}")
-                continue
-            
-            # 폼 제출
-            if not form_submitter.submit_form():
-                results['failed'].append(uddi)
-                results['failed_details'][uddi] = "폼 제출 실패"
-                print(f"  ❌ 폼 제출 실패: {uddi}")
-                continue
-            
-            # 제출 후 대기
-            print("  ⏳ 제출 처리 대기 중...")
-            time.sleep(5)  # 기본 대기 시간 증가
-            
-            # 페이지가 완전히 로드될 때까지 대기
-            try:
-                wait.until(lambda driver: driver.execute_script('return document.readyState') == 'complete')
-            except TimeoutException:
-                logging.warning("제출 후 페이지 로딩 시간 초과")
-            
-            results['success'] += 1
-            print(f"  ✅ 성공: {uddi}")
-            logging.info(f"UDDI 처리 완료: {uddi}")
-            
-            # 다음 처리를 위한 대기
-            time.sleep(5)  # 대기 시간 증가
-            
-        except Exception as e:
-            results['failed'].append(uddi)
-            results['failed_details'][uddi] = f"처리 중 오류: {str(e)}"
-            print(f"  ❌ 오류 발생: {uddi} - {e}")
-            logging.error(f"UDDI 처리 오류 ({uddi}): {e}")
-            continue
+            results['success'] += shard_results['success']
+            results['failed'].extend(shard_results['failed'])
+            results['failed_details'].update(shard_results['failed_details'])
     
     return results
 
 
 def main():
     """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="데이터포털 활용신청 자동화")
+    parser.add_argument("--fresh-login", action="store_true",
+                        help="저장된 브라우저 프로필을 삭제하고 다시 로그인")
+    args = parser.parse_args()
+    
     # 로깅 설정
     setup_logging()
     
@@ -302,16 +530,33 @@ def main():
     
     # 2단계: 브라우저 설정 및 SSO 인증
     print("\n🌐 2단계: 브라우저 설정 및 SSO 인증")
-    driver = setup_driver()
+    if args.fresh_login and os.path.isdir(PROFILE_DIR):
+        shutil.rmtree(PROFILE_DIR)
+        print("🧹 저장된 브라우저 프로필을 삭제했습니다.")
+    
+    try:
+        driver = setup_driver(PROFILE_DIR)
+    except Exception:
+        sys.exit(1)
     
     try:
-        if not wait_for_manual_login(driver):
+        if is_logged_in(driver):
+            logging.info("저장된 프로필로 로그인 상태 확인")
+            print("✅ 저장된 로그인 세션을 사용합니다.")
+        elif not wait_for_manual_login(driver):
             print("로그인에 실패했습니다. 프로그램을 종료합니다.")
             return
         
-        # 3단계: UDDI별 순차 처리
-        print("\n🔄 3단계: UDDI별 순차 처리")
-        results = process_uddi_list(driver, uddi_list)
+        # 3단계: UDDI별 처리
+        block_heavy_resources(driver)
+        if MAX_WORKERS > 1:
+            print(f"\n🔄 3단계: UDDI 병렬 처리 (브라우저 {MAX_WORKERS}개)")
+            # get_cookies()는 현재 페이지 도메인의 쿠키만 반환하므로 로그인 후 SSO 페이지에 남아 있어도 포털 쿠키를 가져오도록 이동
+            driver.get(PORTAL_URL)
+            results = process_uddi_list_parallel(driver.get_cookies(), uddi_list, MAX_WORKERS)
+        else:
+            print("\n🔄 3단계: UDDI별 순차 처리")
+            results = process_uddi_list(driver, uddi_list)
         
         # 4단계: 결과 출력
         print("\n📊 4단계: 처리 결과")
@@ -5,10 +5,23 @@
 유틸리티 함수 모듈
 """
 
+import atexit
+import fnmatch
 import logging
+import logging.handlers
 import os
+import queue
+import re
+import sys
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Union
+
+# UDDI 형식: uddi:<UUID>[_<YYYYMMDDhhmm>] (타임스탬프 없는 UDDI도 허용, 바이트 단위로 검증)
+UDDI_PATTERN = re.compile(rb'uddi:[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}(?:_\d{12})?')
+
+# 정리 대상 임시 파일 패턴 (하나의 정규식으로 묶어 디렉토리를 한 번만 읽음)
+TEMP_FILE_PATTERNS = ("*.tmp", "chromedriver.log", "debug.log")
+TEMP_FILE_REGEX = re.compile("|".join(fnmatch.translate(pattern) for pattern in TEMP_FILE_PATTERNS))
 
 
 def setup_logging():
@@ -19,22 +32,37 @@ def setup_logging():
     log_format = "%(asctime)s - %(levelname)s - %(message)s"
     date_format = "%Y-%m-%d %H:%M:%S"
     
-    # 파일과 콘솔 모두에 로그 출력
-    logging.basicConfig(
-        level=logging.INFO,
-        format=log_format,
-        datefmt=date_format,
-        handlers=[
-            logging.FileHandler(log_filename, encoding='utf-8'),
-            # 콘솔 출력은 ERROR 레벨만 (메인 출력과 중복 방지)
-            logging.StreamHandler()
-        ]
+    formatter = logging.Formatter(log_format, datefmt=date_format)
+    
+    # 파일과 콘솔 모두에 로그 출력 (파일은 10MB 단위로 교체, 최대 3개 보관)
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_filename, maxBytes=10 * 1024 * 1024, backupCount=3, encoding='utf-8'
+    )
+    file_handler.setFormatter(formatter)
+    
+    # 파일 기록은 메모리에 모아 두었다가 1024건마다 또는 ERROR 발생 시 한꺼번에 기록
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        capacity=1024, flushLevel=logging.ERROR, target=file_handler
     )
     
-    # 콘솔 핸들러는 ERROR 레벨만 출력하도록 설정
-    console_handler = logging.getLogger().handlers[1]
+    # 콘솔 출력은 ERROR 레벨만 stderr로 (메인 출력과 중복 방지)
+    console_handler = logging.StreamHandler(sys.stderr)
+    console_handler.setFormatter(formatter)
     console_handler.setLevel(logging.ERROR)
     
+    # 로그 호출은 큐에 넣기만 하고 실제 파일/콘솔 쓰기는 별도 스레드에서 처리
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue, buffered_file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    # 종료 시 큐에 남은 로그를 모두 기록
+    atexit.register(listener.stop)
+    
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
     logging.info("="*60)
     logging.info("데이터포털 활용신청 자동화 워크플로우 시작")
     logging.info("="*60)
@@ -99,10 +127,10 @@ def print_results(results: Dict[str, Any]):
     print("="*60)
     
     # 로그에도 결과 기록
-    logging.info(f"처리 완료 - 전체: {results['total']}, 성공: {results['success']}, 실패: {len(results['failed'])}")
+    logging.info("처리 완료 - 전체: %d, 성공: %d, 실패: %d", results['total'], results['success'], len(results['failed']))
     for uddi in results['failed']:
         reason = results['failed_details'].get(uddi, '알 수 없는 오류')
-        logging.error(f"실패: {uddi} - {reason}")
+        logging.error("실패: %s - %s", uddi, reason)
 
 
 def create_sample_uddi_file():
@@ -165,35 +193,25 @@ def get_timestamp():
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 
-def validate_uddi_format(uddi: str) -> bool:
+def validate_uddi_format(uddi: Union[str, bytes]) -> bool:
     """
     UDDI 형식 검증
     
     Args:
-        uddi: 검증할 UDDI 문자열
+        uddi: 검증할 UDDI 문자열 (또는 바이트)
         
     Returns:
         유효한 형식인지 여부
     """
-    if not uddi or not isinstance(uddi, str):
+    if not uddi:
         return False
     
-    # 기본 형식: uddi:로 시작하고 충분한 길이
-    if not uddi.startswith('uddi:'):
+    if isinstance(uddi, str):
+        uddi = uddi.encode('utf-8')
+    elif not isinstance(uddi, bytes):
         return False
     
-    # 최소 길이 확인 (uddi: + UUID + timestamp 형태)
-    if len(uddi) < 50:  # 대략적인 최소 길이
-        return False
-    
-    # UUID 패턴과 타임스탬프 포함 확인
-    uddi_content = uddi[5:]  # 'uddi:' 제거
-    
-    # 하이픈과 언더스코어 포함 확인 (UUID와 타임스탬프 구분자)
-    if '-' not in uddi_content or '_' not in uddi_content:
-        return False
-    
-    return True
+    return UDDI_PATTERN.fullmatch(uddi) is not None
 
 
 def safe_filename(filename: str) -> str:
@@ -206,7 +224,6 @@ def safe_filename(filename: str) -> str:
     Returns:
         안전한 파일명
     """
-    import re
     # 위험한 문자 제거
     safe_name = re.sub(r'[<>:"/\\|?*]', '_', filename)
     return safe_name
@@ -240,30 +257,25 @@ def log_system_info():
     import sys
     
     logging.info("시스템 정보:")
-    logging.info(f"  - 운영체제: {platform.system()} {platform.release()}")
-    logging.info(f"  - Python 버전: {sys.version}")
-    logging.info(f"  - 작업 디렉토리: {os.getcwd()}")
+    logging.info("  - 운영체제: %s %s", platform.system(), platform.release())
+    logging.info("  - Python 버전: %s", sys.version)
+    logging.info("  - 작업 디렉토리: %s", os.getcwd())
 
 
 def cleanup_temp_files():
     """임시 파일 정리"""
-    temp_patterns = [
-        "*.tmp",
-        "chromedriver.log",
-        "debug.log"
-    ]
-    
-    import glob
-    
     cleaned_files = 0
-    for pattern in temp_patterns:
-        for file_path in glob.glob(pattern):
+    with os.scandir('.') as entries:
+        for entry in entries:
+            # glob과 동일하게 숨김 파일은 제외
+            if entry.name.startswith('.') or not TEMP_FILE_REGEX.match(entry.name) or not entry.is_file():
+                continue
             try:
-                os.remove(file_path)
+                os.remove(entry.path)
                 cleaned_files += 1
-                logging.info(f"임시 파일 삭제: {file_path}")
+                logging.info("임시 파일 삭제: %s", entry.name)
             except Exception as e:
-                logging.warning(f"임시 파일 삭제 실패 ({file_path}): {e}")
+                logging.warning("임시 파일 삭제 실패 (%s): %s", entry.name, e)
     
     if cleaned_files > 0:
         print(f"🧹 {cleaned_files}개의 임시 파일을 정리했습니다.")
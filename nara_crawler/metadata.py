@@ -1,22 +1,53 @@
 import argparse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 import json
 import os
+import socket
 import concurrent.futures
+import itertools
+from collections import defaultdict
 from datetime import datetime
 from tqdm import tqdm
 import time
 import sys
 
+# 존재하지 않는 번호에 대해 200 응답 본문으로 내려오는 안내 문구
+NOT_FOUND_DESCRIPTION = '해당 데이터는 존재하지 않습니다.'
+NOT_FOUND_BYTES = NOT_FOUND_DESCRIPTION.encode('utf-8')
+NOT_FOUND_MAX_BYTES = 512  # 안내 응답 본문의 최대 크기 (이보다 크면 실제 메타데이터로 간주)
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """TCP_NODELAY와 SO_KEEPALIVE를 켠 소켓으로 연결 풀을 구성하는 HTTPAdapter"""
+    
+    SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    ]
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self.SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
 class FileDataMetadataScanner:
     """공공데이터포털 파일데이터 메타데이터 스캐너"""
     
-    def __init__(self, start_num, end_num, max_workers=50, scan_type='fileData'):
+    def __init__(self, start_num, end_num, max_workers=50, scan_type='fileData', keep_raw=False,
+                 cache_file=None, progress_position=0):
         self.start_num = start_num
         self.end_num = end_num
         self.max_workers = max_workers
         self.scan_type = scan_type
+        self.keep_raw = keep_raw  # 원본 메타데이터 전체 보관 여부 (디버깅용)
+        self.cache_file = cache_file  # ETag/Last-Modified 캐시 파일 (None이면 캐시 미사용)
+        self.http_cache = {}  # {번호: {'etag', 'last_modified', 'result'}}
+        self.progress_position = progress_position  # 여러 타입 동시 스캔 시 진행바 표시 줄
         self.base_url = f"https://www.data.go.kr/catalog/{{}}/{scan_type}.json"
+        # 요청마다 템플릿을 해석하지 않도록 번호 앞뒤 문자열을 미리 분리
+        self._url_prefix, self._url_suffix = self.base_url.split("{}")
         self.results = {
             'total': 0,
             'with_data': 0,
@@ -24,58 +55,98 @@ class FileDataMetadataScanner:
             'failed': 0,
             'file_numbers': [],
             'file_types': {},  # 파일 타입별 통계
+            'org_stats': {},  # 제공 기관별 통계 (파일이 있는 것만)
             'details': {}
         }
         
+        # 작업자 간에 연결을 재사용해 요청마다 TCP/TLS 핸드셰이크를 반복하지 않음
+        self.session = requests.Session()
+        retry = Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET']),
+            raise_on_status=False
+        )
+        # pool_block: 풀 크기를 넘는 연결을 새로 만들었다 버리지 않고 반납된 연결을 기다려 재사용
+        adapter = KeepAliveAdapter(pool_connections=max_workers, pool_maxsize=max_workers,
+                                   max_retries=retry, pool_block=True)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
     def check_metadata(self, num):
         """단일 파일데이터 메타데이터 조회"""
-        url = self.base_url.format(num)
+        url = f"{self._url_prefix}{num}{self._url_suffix}"
+        
+        # 이전 실행에서 받은 검증값이 있으면 조건부 요청으로 변경 여부만 확인
+        headers = {}
+        cached = self.http_cache.get(num)
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
         
         try:
-            response = requests.get(url, timeout=5)
+            response = self.session.get(url, headers=headers, timeout=(3.05, 5))
+            
+            if response.status_code == 304 and cached:
+                # 변경 없음: 이전 결과 재사용
+                return dict(cached['result'])
             
             if response.status_code == 200:
-                data = response.json()
+                content = response.content
+                
+                # 짧은 '데이터 없음' 응답은 JSON 디코딩 없이 바이트 비교로 판별
+                data = None
+                if len(content) > NOT_FOUND_MAX_BYTES or NOT_FOUND_BYTES not in content:
+                    # 응답 바이트를 바로 디코딩 (텍스트 변환 단계 생략, 형식 오류는 JSONDecodeError로 처리)
+                    data = json.loads(content)
                 
                 # 데이터셋 존재 여부 확인
-                if (
+                if data is None or (
                     'description' in data and 
-                    data['description'] == '해당 데이터는 존재하지 않습니다.'
+                    data['description'] == NOT_FOUND_DESCRIPTION
                 ):
-                    return {
+                    file_info = {
                         'number': num,
                         'has_data': False,
                         'status': 'not_found',
                         'error': '파일데이터 메타데이터 없음'
                     }
+                else:
+                    # 파일 데이터 존재 여부 확인
+                    has_data = bool(data)  # 데이터가 있으면 True
+                    
+                    # 파일 관련 정보 추출
+                    file_info = {
+                        'number': num,
+                        'has_data': has_data,
+                        'title': data.get('title', ''),
+                        'organization': data.get('organization', ''),
+                        'description': data.get('description', ''),
+                        'file_type': data.get('fileType', data.get('format', '')),
+                        'file_size': data.get('fileSize', ''),
+                        'download_url': data.get('url', ''),
+                        'update_date': data.get('updateDate', data.get('modified', '')),
+                        'license': data.get('license', ''),
+                        'status': 'success'
+                    }
+                    
+                    # 파일 타입은 결과를 모으는 스레드에서 대문자로 집계하므로 문자열이 아니면 오류로 처리
+                    if file_info['file_type'] and not isinstance(file_info['file_type'], str):
+                        raise TypeError(f"잘못된 파일 타입: {file_info['file_type']!r}")
+                    
+                    # 원본 응답은 메모리를 많이 차지하므로 요청한 경우에만 보관
+                    if self.keep_raw:
+                        file_info['metadata'] = data
                 
-                # 파일 데이터 존재 여부 확인
-                has_data = bool(data)  # 데이터가 있으면 True
-                
-                # 파일 관련 정보 추출
-                file_info = {
-                    'number': num,
-                    'has_data': has_data,
-                    'title': data.get('title', ''),
-                    'organization': data.get('organization', ''),
-                    'description': data.get('description', ''),
-                    'file_type': data.get('fileType', data.get('format', '')),
-                    'file_size': data.get('fileSize', ''),
-                    'download_url': data.get('url', ''),
-                    'update_date': data.get('updateDate', data.get('modified', '')),
-                    'license': data.get('license', ''),
-                    'status': 'success',
-                    'metadata': data
-                }
-                
-                # 파일 타입 통계 업데이트
-                if file_info['file_type']:
-                    file_type = file_info['file_type'].upper()
-                    self.results['file_types'][file_type] = self.results['file_types'].get(file_type, 0) + 1
+                # 검증값은 결과를 모으는 스레드에서 캐시에 반영
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+                if etag or last_modified:
+                    file_info['cache'] = {'etag': etag, 'last_modified': last_modified}
                 
-                if has_data and (file_info['download_url'] or file_info['title']):
-                    self.results['file_numbers'].append(num)
-                    
                 return file_info
                 
             elif response.status_code == 404:
@@ -122,70 +193,131 @@ class FileDataMetadataScanner:
                 'error': str(e)
             }
     
-    def scan_range(self):
-        """지정된 범위의 파일데이터 메타데이터 스캔"""
+    def load_http_cache(self, verbose=True):
+        """이전 실행의 ETag/Last-Modified 캐시 로드 (verbose가 False면 항목 수 출력 생략)"""
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return
+        
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                # JSON 키는 문자열이므로 번호로 변환
+                self.http_cache = {int(num): entry for num, entry in json.load(f).items()}
+            if verbose:
+                print(f"   🗂️  HTTP 캐시: {len(self.http_cache):,}개 항목")
+        except (OSError, ValueError) as e:
+            print(f"⚠️  HTTP 캐시를 읽지 못해 무시합니다: {e}")
+            self.http_cache = {}
+    
+    def save_http_cache(self):
+        """ETag/Last-Modified 캐시 저장"""
+        if not self.cache_file or not self.http_cache:
+            return
+        
+        os.makedirs(os.path.dirname(self.cache_file) or '.', exist_ok=True)
+        with open(self.cache_file, 'w', encoding='utf-8') as f:
+            json.dump(self.http_cache, f, ensure_ascii=False)
+    
+    def scan_range(self, show_header=True):
+        """지정된 범위의 파일데이터 메타데이터 스캔 (show_header가 False면 시작 안내 출력 생략)"""
         total_numbers = self.end_num - self.start_num + 1
         self.results['total'] = total_numbers
         
-        print(f"\n🔍 파일데이터 메타데이터 스캔 시작")
-        print(f"   📋 범위: {self.start_num} ~ {self.end_num}")
-        print(f"   📊 총 {total_numbers:,}개 번호")
-        print(f"   👥 동시 작업자: {self.max_workers}개")
-        print(f"   🌐 Base URL: {self.base_url}")
+        if show_header:
+            print(f"\n🔍 파일데이터 메타데이터 스캔 시작")
+            print(f"   📋 범위: {self.start_num} ~ {self.end_num}")
+            print(f"   📊 총 {total_numbers:,}개 번호")
+            print(f"   👥 동시 작업자: {self.max_workers}개")
+            print(f"   🌐 Base URL: {self.base_url}")
+        
+        # 이전 실행의 캐시 로드
+        self.load_http_cache(verbose=show_header)
         
         # 시작 시간 기록
         start_time = datetime.now()
         
-        # 병렬 처리로 메타데이터 조회
-        numbers = list(range(self.start_num, self.end_num + 1))
+        # 병렬 처리로 메타데이터 조회 (번호 목록은 만들지 않고 range로 순회)
+        numbers = range(self.start_num, self.end_num + 1)
+        
+        # 파일이 있는 번호는 범위 내 위치별 플래그로 기록 (스캔 후 정렬 없이 순서대로 추출)
+        has_file = bytearray(total_numbers)
         
         with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # 모든 작업 제출
+            # 진행 중인 작업은 작업자 수의 2배까지만 유지하고, 끝난 만큼 새로 제출
+            pending_numbers = iter(numbers)
             future_to_num = {
-                executor.submit(self.check_metadata, num): num 
-                for num in numbers
+                executor.submit(self.check_metadata, num): num
+                for num in itertools.islice(pending_numbers, self.max_workers * 2)
             }
             
             # 진행 상황 표시와 함께 결과 처리
-            with tqdm(total=total_numbers, desc="스캔 진행") as pbar:
-                for future in concurrent.futures.as_completed(future_to_num):
-                    num = future_to_num[future]
+            with tqdm(total=total_numbers, desc=f"{self.scan_type} 스캔 진행", position=self.progress_position) as pbar:
+                last_postfix_time = time.monotonic()
+                while future_to_num:
+                    done, _ = concurrent.futures.wait(
+                        future_to_num, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
                     
-                    try:
-                        result = future.result()
+                    for future in done:
+                        num = future_to_num.pop(future)
                         
-                        # 결과 저장
-                        self.results['details'][num] = result
-                        
-                        # 통계 업데이트
-                        if result['status'] == 'success':
-                            if result['has_data']:
-                                self.results['with_data'] += 1
+                        try:
+                            result = future.result()
+                            
+                            # 새로 받은 검증값을 캐시에 반영
+                            validators = result.pop('cache', None)
+                            if validators:
+                                self.http_cache[num] = dict(validators, result=result)
+                            
+                            # 결과 저장
+                            self.results['details'][num] = result
+                            
+                            # 통계 업데이트 (작업 스레드가 아닌 이 스레드에서만 results를 수정)
+                            if result['status'] == 'success':
+                                if result['has_data']:
+                                    self.results['with_data'] += 1
+                                    
+                                    # 제공 기관 통계 업데이트
+                                    org = result.get('organization')
+                                    if org:
+                                        self.results['org_stats'][org] = self.results['org_stats'].get(org, 0) + 1
+                                else:
+                                    self.results['without_data'] += 1
+                                
+                                # 파일 타입 통계 업데이트
+                                if result['file_type']:
+                                    file_type = result['file_type'].upper()
+                                    self.results['file_types'][file_type] = self.results['file_types'].get(file_type, 0) + 1
+                                
+                                if result['has_data'] and (result['download_url'] or result['title']):
+                                    has_file[num - self.start_num] = 1
                             else:
-                                self.results['without_data'] += 1
-                        else:
+                                self.results['failed'] += 1
+                            
+                        except Exception as e:
                             self.results['failed'] += 1
+                            self.results['details'][num] = {
+                                'number': num,
+                                'has_data': False,
+                                'status': 'exception',
+                                'error': str(e)
+                            }
                         
-                    except Exception as e:
-                        self.results['failed'] += 1
-                        self.results['details'][num] = {
-                            'number': num,
-                            'has_data': False,
-                            'status': 'exception',
-                            'error': str(e)
-                        }
-                    
-                    pbar.update(1)
+                        pbar.update(1)
+                        
+                        # 진행 상황 업데이트 (처리 건수가 아닌 0.5초 간격으로 갱신)
+                        now = time.monotonic()
+                        if now - last_postfix_time >= 0.5:
+                            last_postfix_time = now
+                            success_rate = (self.results['with_data'] / pbar.n * 100) if pbar.n > 0 else 0
+                            pbar.set_postfix({
+                                '파일있음': self.results['with_data'],
+                                '파일없음': self.results['without_data'],
+                                '실패': self.results['failed'],
+                                '성공률': f"{success_rate:.1f}%"
+                            })
                     
-                    # 진행 상황 업데이트
-                    if pbar.n % 100 == 0:
-                        success_rate = (self.results['with_data'] / pbar.n * 100) if pbar.n > 0 else 0
-                        pbar.set_postfix({
-                            '파일있음': self.results['with_data'],
-                            '파일없음': self.results['without_data'],
-                            '실패': self.results['failed'],
-                            '성공률': f"{success_rate:.1f}%"
-                        })
+                    for num in itertools.islice(pending_numbers, len(done)):
+                        future_to_num[executor.submit(self.check_metadata, num)] = num
         
         # 종료 시간 및 소요 시간 계산
         end_time = datetime.now()
@@ -199,8 +331,11 @@ class FileDataMetadataScanner:
             'elapsed_formatted': self._format_elapsed_time(elapsed_time)
         }
         
-        # 파일 번호 정렬
-        self.results['file_numbers'].sort()
+        # 파일 번호 목록 생성 (플래그 순서가 곧 번호 순서이므로 정렬 불필요)
+        self.results['file_numbers'] = list(itertools.compress(numbers, has_file))
+        
+        # 다음 실행을 위해 캐시 저장
+        self.save_http_cache()
         
         return self.results
     
@@ -245,49 +380,48 @@ class FileDataMetadataScanner:
                 'file_count': len(self.results['file_numbers'])
             }, f, ensure_ascii=False, indent=2)
         
-        # 2. 파일데이터가 있는 번호만 별도 저장
+        # 2. 파일데이터가 있는 번호만 별도 저장 (번호 목록 파일은 들여쓰기 없이 한 번에 직렬화)
         file_numbers_file = os.path.join(timestamp_dir, "file_numbers.json")
         with open(file_numbers_file, 'w', encoding='utf-8') as f:
-            json.dump({
+            f.write(json.dumps({
                 'file_numbers': self.results['file_numbers'],
                 'count': len(self.results['file_numbers']),
                 'scan_info': {
                     'range': f"{self.start_num}-{self.end_num}",
                     'timestamp': timestamp
                 }
-            }, f, ensure_ascii=False, indent=2)
+            }, ensure_ascii=False))
         
-        # 3. 파일 번호 목록을 텍스트 파일로도 저장
+        # 3. 파일 번호 목록을 텍스트 파일로도 저장 (한 번의 write로 기록)
         file_list_file = os.path.join(timestamp_dir, "file_numbers.txt")
         with open(file_list_file, 'w', encoding='utf-8') as f:
-            for num in self.results['file_numbers']:
-                f.write(f"{num}\n")
-        
-        # 4. 상세 파일데이터 메타데이터 저장 (파일이 있는 것만)
-        file_metadata_file = os.path.join(timestamp_dir, "file_metadata.json")
-        file_metadata = {
-            num: details for num, details in self.results['details'].items()
-            if details.get('has_data', False)
-        }
+            if self.results['file_numbers']:
+                f.write("\n".join(map(str, self.results['file_numbers'])) + "\n")
+        
+        # 4. 상세 파일데이터 메타데이터 저장 (파일이 있는 것만, 전체 객체를 만들지 않고 한 줄에 한 건씩 기록)
+        file_metadata_file = os.path.join(timestamp_dir, "file_metadata.jsonl")
         with open(file_metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(file_metadata, f, ensure_ascii=False, indent=2)
-        
-        # 5. 파일 타입별 번호 목록 저장
-        for file_type, count in self.results['file_types'].items():
-            if count > 0:
-                type_numbers = []
-                for num, details in self.results['details'].items():
-                    if details.get('file_type', '').upper() == file_type:
-                        type_numbers.append(num)
-                
-                if type_numbers:
-                    type_file = os.path.join(timestamp_dir, f"file_type_{file_type}.json")
-                    with open(type_file, 'w', encoding='utf-8') as f:
-                        json.dump({
-                            'file_type': file_type,
-                            'numbers': type_numbers,
-                            'count': len(type_numbers)
-                        }, f, ensure_ascii=False, indent=2)
+            f.writelines(
+                json.dumps(details, ensure_ascii=False) + "\n"
+                for details in self.results['details'].values()
+                if details.get('has_data', False)
+            )
+        
+        # 5. 파일 타입별 번호 목록 저장 (상세 결과를 한 번만 순회하며 타입별로 분류)
+        numbers_by_type = defaultdict(list)
+        for num, details in self.results['details'].items():
+            file_type = details.get('file_type', '').upper()
+            if file_type:
+                numbers_by_type[file_type].append(num)
+        
+        for file_type, type_numbers in numbers_by_type.items():
+            type_file = os.path.join(timestamp_dir, f"file_type_{file_type}.json")
+            with open(type_file, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({
+                    'file_type': file_type,
+                    'numbers': type_numbers,
+                    'count': len(type_numbers)
+                }, ensure_ascii=False))
         
         # 6. 실패한 번호들 저장
         failed_numbers = [
@@ -298,11 +432,11 @@ class FileDataMetadataScanner:
         if failed_numbers:
             failed_file = os.path.join(timestamp_dir, "failed_numbers.json")
             with open(failed_file, 'w', encoding='utf-8') as f:
-                json.dump({
+                f.write(json.dumps({
                     'failed_numbers': failed_numbers,
                     'count': len(failed_numbers),
                     'details': {num: self.results['details'][num] for num in failed_numbers}
-                }, f, ensure_ascii=False, indent=2)
+                }, ensure_ascii=False))
         
         return {
             'summary_file': summary_file,
@@ -336,12 +470,8 @@ class FileDataMetadataScanner:
                 percentage = count / self.results['with_data'] * 100 if self.results['with_data'] > 0 else 0
                 print(f"   - {file_type}: {count}개 ({percentage:.1f}%)")
         
-        # 상위 5개 기관 통계 (파일이 있는 것만)
-        org_stats = {}
-        for details in self.results['details'].values():
-            if details.get('has_data') and details.get('organization'):
-                org = details['organization']
-                org_stats[org] = org_stats.get(org, 0) + 1
+        # 상위 5개 기관 통계 (파일이 있는 것만, 스캔 중에 집계됨)
+        org_stats = self.results['org_stats']
         
         if org_stats:
             print(f"\n🏢 상위 제공 기관:")
@@ -350,6 +480,14 @@ class FileDataMetadataScanner:
                 print(f"   - {org}: {count}개")
 
 
+def scan_in_process(start_num, end_num, max_workers, scan_type, keep_raw, cache_file, progress_position):
+    """별도 프로세스에서 한 타입을 스캔하고 결과 딕셔너리 반환 (ProcessPoolExecutor용)"""
+    scanner = FileDataMetadataScanner(start_num, end_num, max_workers, scan_type, keep_raw,
+                                      cache_file, progress_position)
+    # 여러 프로세스의 시작 안내가 섞이지 않도록 안내는 부모 프로세스에서 한 번만 출력
+    return scanner.scan_range(show_header=False)
+
+
 def main():
     """메인 함수"""
     parser = argparse.ArgumentParser(
@@ -375,7 +513,11 @@ def main():
     parser.add_argument('-o', '--output', type=str, default='results',
                        help='결과 저장 디렉토리 (기본값: results)')
     parser.add_argument('-t', '--type', type=str, choices=['openapi', 'fileData', 'standard'],
-                       help='스캔할 타입 (openapi, fileData, standard). 지정하지 않으면 모든 타입을 순차적으로 스캔')
+                       help='스캔할 타입 (openapi, fileData, standard). 지정하지 않으면 모든 타입을 동시에 스캔')
+    parser.add_argument('--keep-raw', action='store_true',
+                       help='원본 메타데이터 전체를 결과에 포함 (메모리 사용량 증가)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='ETag/Last-Modified 캐시를 사용하지 않고 모든 번호를 새로 조회')
     
     args = parser.parse_args()
     
@@ -395,18 +537,50 @@ def main():
     # 스캔할 타입 결정
     scan_types = ['openapi', 'fileData', 'standard'] if args.type is None else [args.type]
     
-    # 각 타입별로 스캔 실행
+    # 여러 타입을 동시에 스캔할 때는 전체 동시 작업자 수를 타입별로 나눠 서버 부하를 유지
+    workers = max(1, args.workers // len(scan_types))
+    
+    # 타입별 캐시 파일 경로 (None이면 캐시 미사용)
+    cache_files = {
+        scan_type: None if args.no_cache else os.path.join(args.output, scan_type, "http_cache.json")
+        for scan_type in scan_types
+    }
+    
+    # 타입이 여러 개이면 타입별 프로세스에서 동시에 스캔 (결과 저장/출력은 아래에서 순서대로)
+    futures = {}
+    if len(scan_types) > 1:
+        print(f"\n🔍 {len(scan_types)}개 타입 동시 스캔 시작 (타입별 작업자 {workers}개)")
+        print(f"   📋 범위: {args.start} ~ {args.end}")
+        print(f"   📊 타입별 {args.end - args.start + 1:,}개 번호")
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=len(scan_types)) as executor:
+                # 스캐너(세션/연결 풀)는 각 프로세스에서 만들고 여기서는 인자만 전달
+                futures = {
+                    scan_type: executor.submit(
+                        scan_in_process, args.start, args.end, workers, scan_type,
+                        args.keep_raw, cache_files[scan_type], position
+                    )
+                    for position, scan_type in enumerate(scan_types)
+                }
+        except KeyboardInterrupt:
+            print("\n\n⚠️  스캔이 사용자에 의해 중단되었습니다.")
+            sys.exit(1)
+    
+    # 각 타입별로 결과 처리
     for scan_type in scan_types:
         print(f"\n{'='*60}")
-        print(f"🔍 {scan_type.upper()} 타입 스캔 시작")
+        print(f"🔍 {scan_type.upper()} 타입 스캔 결과")
         print(f"{'='*60}")
         
-        # 스캐너 생성 및 실행
-        scanner = FileDataMetadataScanner(args.start, args.end, args.workers, scan_type)
+        scanner = FileDataMetadataScanner(args.start, args.end, workers, scan_type,
+                                          args.keep_raw, cache_files[scan_type])
         
         try:
-            # 메타데이터 스캔
-            scanner.scan_range()
+            # 메타데이터 스캔 (동시 스캔한 경우 결과만 받아옴)
+            if scan_type in futures:
+                scanner.results = futures[scan_type].result()
+            else:
+                scanner.scan_range()
             
             # 결과 저장 (results/[type명]/[타임스탬프]/ 형태로 저장)
             saved_files = scanner.save_results(args.output)